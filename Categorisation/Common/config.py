@@ -82,6 +82,8 @@ TINK_LOGFILE = 'logs/tink.log'  # Default name of the Tink processing log file
 
 UI_STRING_MAX_WITH = 200  # Default value for the with of the output text in the ui
 
+UI_LOG_MAX_LINES = 5000  # Maximum number of lines kept in the result log of the ui (oldest are dropped)
+
 LOG_LEVEL = logging.DEBUG  # Default log level for logging
 
 UI_RESULT_LOG_MSG_DETAIL = MessageDetailLevel.Low
@@ -6,12 +6,10 @@ Working With JSON Data in Python: https://realpython.com/python-json/
 """
 import Categorisation.Common.config as cfg
 
-import tkinter.filedialog as filedialog
 import csv
 import json
 import os
 import logging
-import sys
 
 
 class FileHandler:
@@ -28,8 +26,7 @@ class FileHandler:
         :return: a python ``Object`` (``dict``) representing the json read from the file.
         :raise Exception: Any exception that could potentially occur will be raised.
         """
-        msg = f'{self.__class__.__name__}.{sys._getframe().f_code.co_name}'
-        logging.info(msg)
+        logging.info('FileHandler.read_json_file')
 
         extension = os.path.splitext(filename)[1]
         try:
@@ -50,8 +47,7 @@ class FileHandler:
         :param filename: the full qualified filename (path + file)
         :return: True if the file was written successfully, otherwise False
         """
-        msg = f'{self.__class__.__name__}.{sys._getframe().f_code.co_name}'
-        logging.info(msg)
+        logging.info('FileHandler.write_json_file')
 
         try:
             json_file = open(filename, 'w')
@@ -73,15 +69,30 @@ class FileHandler:
         :param skip_header: flag indicating to ignore the first row
         :return: The CSV data as an instance of <class 'list'>: [OrderedDict()]
         """
-        msg = f'{self.__class__.__name__}.{sys._getframe().f_code.co_name}'
-        logging.info(msg)
+        logging.info('FileHandler.read_csv_file')
+
+        return list(self.iter_csv_file(filename=filename,
+                                       fieldnames=fieldnames,
+                                       skip_header=skip_header))
+
+    def iter_csv_file(self, filename, fieldnames=None, skip_header=True):
+        """
+        Read a CSV file from the local file system row by row. The file stays open until
+        all rows have been read or the generator is closed.
+
+        :param filename: the full qualified filename (path + file)
+        :param fieldnames: a tuple of strings containing the name of all the fields of interest
+        :param skip_header: flag indicating to ignore the first row
+        :return: Generator of the CSV rows as instances of <class 'dict'>
+        """
+        logging.info('FileHandler.iter_csv_file')
 
-        csv_data = list()
         extension = os.path.splitext(filename)[1]
 
-        if extension in ('.data', '.txt', '.csv'):
-            csv_file = open(filename, 'r')
+        if extension not in ('.data', '.txt', '.csv'):
+            return
 
+        with open(filename, 'r') as csv_file:
             if fieldnames:
                 csv_reader = csv.DictReader(f=csv_file,
                                             delimiter=cfg.CSV_DELIMITER,
@@ -89,20 +100,16 @@ class FileHandler:
             else:
                 csv_reader = csv.DictReader(f=csv_file,
                                             delimiter=cfg.CSV_DELIMITER)
-            csv_data = list()
 
             if skip_header:
-                next(csv_reader)  # This skips the first row of the data file
+                next(csv_reader, None)  # This skips the first row of the data file
             try:
-                for row in csv_reader:
-                    csv_data.append(row)
+                yield from csv_reader
             except Exception as ex:
                 msg = f'csv.DictReader row {csv_reader.line_num} => {ex}'
                 logging.error(msg)
                 raise ex
 
-        return csv_data
-
     def write_csv_file(self, data, fieldnames, filename):
         """
         Write a CSV file to the local file system.
@@ -111,8 +118,7 @@ class FileHandler:
         :param filename: the full qualified filename (path + file)
         :return: True if the file was written successfully, otherwise False
         """
-        msg = f'{self.__class__.__name__}.{sys._getframe().f_code.co_name}'
-        logging.info(msg)
+        logging.info('FileHandler.write_csv_file')
 
         try:
             csv_file = open(filename, 'w')
@@ -133,14 +139,29 @@ def list_to_string(lst):
     :param lst: a list of tuples List<Tuple>
     :return: a text in format  key1:value1, key2:value2, ...
     """
-    text = ''
-    for e in enumerate(lst):
-        for k, v in e[1].items():
-            text = text + f'{k}:{v},'
-        # Replace last ',' with a '\n' character using slicing.
-        text = text[:-1] + os.linesep
+    # Build each line and the text with join (repeated concatenation copies the text per value)
+    return ''.join([','.join([f'{k}:{v}' for k, v in e.items()]) + '\n' for e in lst])
 
-    return text
+
+def csv_rows_to_string(rows):
+    """
+    Function to print the rows of a CSV file (see FileHandler.read_csv_file) as a better
+    readable formatted string like list_to_string. All rows of a csv.DictReader share the
+    field names of the header in the same order, so a format template is built once from
+    the first row and the values of each row are filled in with a single format call.
+
+    :param rows: a list of rows as returned by FileHandler.read_csv_file List<Dict>
+    :return: a text in format  key1:value1, key2:value2, ...
+    """
+    if not rows:
+        return ''
+
+    fields = len(rows[0])
+    template = ','.join(str(k).replace('{', '{{').replace('}', '}}') + ':{}' for k in rows[0]) + '\n'
+    line = template.format
+
+    # Rows with surplus values (stored under an extra key) are formatted the generic way
+    return ''.join([line(*e.values()) if len(e) == fields else list_to_string((e,)) for e in rows])
 
 
 def strdate(date):
@@ -151,15 +172,26 @@ def strdate(date):
     return date.strftime('%d.%m.%Y %H:%M:%S')
 
 
-def save_to_file(data):
+def ask_save_file_name():
+    """
+    Select the file to save data into using a file dialog.
+    :return: The selected file name or '' if the user cancelled the dialog.
+    """
+    # Imported on first use only (loads tkinter which the non-ui users of this module do not need)
+    import tkinter.filedialog as filedialog
+
+    return filedialog.asksaveasfilename(filetypes=cfg.SUPPORTED_FILE_TYPES,
+                                        defaultextension='*.txt')
+
+
+def write_to_file(file_name, data, append=False):
     """
-    Save data into a file using a file dialog in order to select the target file.
+    Write data into a file.
+    :param file_name: The full qualified filename (path + file).
     :param data: The data to be written to file.
+    :param append: Flag indicating whether to append the data instead of overwriting the file.
     :return:
     """
-    file_name = filedialog.asksaveasfilename(filetypes=cfg.SUPPORTED_FILE_TYPES,
-                                             defaultextension='*.txt')
-    # Save file if user entered a file name
-    if file_name != '':
-        with open(file_name, 'w') as output_file:
-            output_file.writelines(data)
+    # The data is written in one call through a large buffer
+    with open(file_name, 'a' if append else 'w', encoding='utf-8', buffering=1024 * 1024) as output_file:
+        output_file.write(data)
@@ -7,7 +7,6 @@ import Categorisation.Tink.model as model
 
 import Categorisation.Common.exceptions as ex
 import Categorisation.Tink.api as api
-import sys
 import collections
 import logging
 import abc  # https://pymotw.com/3/abc/
@@ -119,7 +118,7 @@ class TinkDAO:
         :raise Exception: Any other error that might occur in a method invoced within this
         method will be caught and raised.
         """
-        msg = f'{self.__class__.__name__}.{sys._getframe().f_code.co_name}'
+        msg = f'{self.__class__.__name__}.data_access'
         logging.info(msg)
         logging.info(f'access_type: {access_type}')
         logging.info(f'entity_type: {entity_type.value}')
@@ -9,12 +9,25 @@ import Categorisation.Tink.data as data
 
 import logging
 import os
-import sys
+import types
 import collections
 
 from enum import Enum
 
 
+# Output filters of the supported actions by method name (shared by all model instances)
+_ACTION_FILTERS = types.MappingProxyType({
+    'test_connectivity': types.MappingProxyType({'endpoints': ()}),
+    'list_categories': types.MappingProxyType({'endpoints': ('/categories',)}),
+    'delete_users': types.MappingProxyType({'endpoints': ('/user/delete',)}),
+    'activate_users': types.MappingProxyType({'endpoints': ('/user/delete', '/user/create')}),
+    'get_users': types.MappingProxyType({'endpoints': ('/user',)}),
+    'ingest_accounts': types.MappingProxyType({'endpoints': ('/accounts',)}),
+    'get_all_accounts': types.MappingProxyType({'endpoints': ('/accounts/list',)}),
+    'ingest_transactions': types.MappingProxyType({'endpoints': ('/transactions',)}),
+})
+
+
 class TinkModel:
 
     """
@@ -47,6 +60,7 @@ class TinkModel:
         # corresponding property
         self._supported_actions = self._define_supported_actions()
         self._process_actions = self._define_process_actions()
+        self._action_filters = {a['method']: a['filters'] for a in self._supported_actions}
 
     def _define_supported_actions(self):
         """
@@ -63,35 +77,7 @@ class TinkModel:
 
         # Define supported actions
         for method in methods:
-            action = {'method': method}
-            filters = {}
-
-            if method == self.test_connectivity:
-                filters.update({'endpoints': []})
-                action.update({'filters': filters})
-            elif method == self.list_categories:
-                filters.update({'endpoints': ['/categories']})
-                action.update({'filters': filters})
-            elif method == self.delete_users:
-                filters.update({'endpoints': ['/user/delete']})
-                action.update({'filters': filters})
-            elif method == self.activate_users:
-                filters.update({'endpoints': ['/user/delete', '/user/create']})
-                action.update({'filters': filters})
-            elif method == self.get_users:
-                filters.update({'endpoints': ['/user']})
-                action.update({'filters': filters})
-            elif method == self.ingest_accounts:
-                filters.update({'endpoints': ['/accounts']})
-                action.update({'filters': filters})
-            elif method == self.get_all_accounts:
-                filters.update({'endpoints': ['/accounts/list']})
-                action.update({'filters': filters})
-            elif method == self.ingest_transactions:
-                filters.update({'endpoints': ['/transactions']})
-                action.update({'filters': filters})
-
-            actions.append(action)
+            actions.append({'method': method, 'filters': _ACTION_FILTERS[method.__name__]})
 
         return actions
 
@@ -132,12 +118,7 @@ class TinkModel:
         Get the current output filter for a supported action (method reference).
         :return: The output filter for the supplied method reference.
         """
-        for action in self._supported_actions:
-            if action['method'] == method:
-                filters = action['filters']
-                return filters
-
-        return None
+        return self._action_filters.get(method)
 
     def save_data_to_file(self,
                           entity_type: cfg.EntityType,
@@ -149,7 +130,7 @@ class TinkModel:
         Persists data for a valid entity over the DAO.
         :return: TinkModelResultList object.
         """
-        msg = f'{self.__class__.__name__}.{sys._getframe().f_code.co_name}'
+        msg = f'{self.__class__.__name__}.save_data_to_file'
         logging.info(msg)
 
         msg = f'Save results to "{locator}"'
@@ -193,7 +174,7 @@ class TinkModel:
         :param ext_user_id:
         :return:
         """
-        msg = f'{self.__class__.__name__}.{sys._getframe().f_code.co_name}'
+        msg = f'{self.__class__.__name__}._oauth2_client_credentials_flow'
         logging.info(msg)
 
         result_list = TinkModelResultList(result=None,
@@ -262,7 +243,7 @@ class TinkModel:
         containing an instance of api.OAuth2AuthenticationTokenResponse with a
         client access token {ACCESS_TOKEN}.
         """
-        msg = f'{self.__class__.__name__}.{sys._getframe().f_code.co_name}'
+        msg = f'{self.__class__.__name__}._authorize_client'
         logging.info(msg)
 
         service = api.OAuthService()
@@ -298,7 +279,7 @@ class TinkModel:
         :return: TinkModelResultList wrapping TinkModelResult objects of all API calls performed
         containing an instance of api.OAuth2AuthorizeResponse with an authorization code {CODE}.
         """
-        msg = f'{self.__class__.__name__}.{sys._getframe().f_code.co_name}'
+        msg = f'{self.__class__.__name__}._grant_user_access'
         logging.info(msg)
 
         service = api.OAuthService()
@@ -342,7 +323,7 @@ class TinkModel:
         containing an instance of api.OAuth2AuthenticationTokenResponse with a
         client access token {ACCESS_TOKEN}.
         """
-        msg = f'{self.__class__.__name__}.{sys._getframe().f_code.co_name}'
+        msg = f'{self.__class__.__name__}._get_oauth2_access_token'
         logging.info(msg)
 
         service = api.OAuthService()
@@ -364,7 +345,7 @@ class TinkModel:
 
         :return: TinkModelResultList wrapping TinkModelResult objects of all AP calls performed
         """
-        msg = f'{self.__class__.__name__}.{sys._getframe().f_code.co_name}'
+        msg = f'{self.__class__.__name__}.test_connectivity'
         logging.info(msg)
 
         service = api.MonitoringService()
@@ -407,7 +388,7 @@ class TinkModel:
         containing an instance of api.UserActivationResponse with a unique identifier of
         the user created {USER_ID}.
         """
-        msg = f'{self.__class__.__name__}.{sys._getframe().f_code.co_name}'
+        msg = f'{self.__class__.__name__}.activate_user'
         logging.info(msg)
 
         # Wrapper for the results
@@ -477,7 +458,7 @@ class TinkModel:
         containing instances of api.UserActivationResponse with a unique identifier of
         the users deleted {USER_ID}.
         """
-        msg = f'{self.__class__.__name__}.{sys._getframe().f_code.co_name}'
+        msg = f'{self.__class__.__name__}.activate_users'
         logging.info(msg)
 
         users = self._dao.users.data
@@ -530,7 +511,7 @@ class TinkModel:
 
         :raise ExUserNotExisting: in case the user to be deleted does not exist
         """
-        msg = f'{self.__class__.__name__}.{sys._getframe().f_code.co_name}'
+        msg = f'{self.__class__.__name__}.delete_user'
         logging.debug(msg)
 
         # Wrapper for the results
@@ -572,7 +553,7 @@ class TinkModel:
         containing instances of api.UserDeleteResponse with a unique identifier of
         the users deleted {USER_ID}.
         """
-        msg = f'{self.__class__.__name__}.{sys._getframe().f_code.co_name}'
+        msg = f'{self.__class__.__name__}.delete_users'
         logging.info(msg)
 
         # Wrapper for the results
@@ -607,7 +588,7 @@ class TinkModel:
         the user deleted {USER_ID}.
         :raise ExUserNotExisting: in case the user to be deleted does not exist
         """
-        msg = f'{self.__class__.__name__}.{sys._getframe().f_code.co_name}'
+        msg = f'{self.__class__.__name__}.get_user'
         logging.debug(msg)
 
         # Wrapper for the results
@@ -648,7 +629,7 @@ class TinkModel:
         containing instances of api.UserResponse with a unique identifier of
         the users {USER_ID}.
         """
-        msg = f'{self.__class__.__name__}.{sys._getframe().f_code.co_name}'
+        msg = f'{self.__class__.__name__}.get_users'
         logging.info(msg)
 
         # Wrapper for the results
@@ -695,7 +676,7 @@ class TinkModel:
         :param ext_user_id: External user reference (this is NOT the Tink internal id).
         :return: Boolean - True if the user exists, otherwise False.
         """
-        msg = f'{self.__class__.__name__}.{sys._getframe().f_code.co_name}'
+        msg = f'{self.__class__.__name__}.user_exists'
         logging.info(msg)
         try:
             self.delete_user(ext_user_id=ext_user_id, no_delete=True)
@@ -720,7 +701,7 @@ class TinkModel:
         401	User not found, has no credentials, or has more than one set of credentials.
         409	Account already exists.
         """
-        msg = f'{self.__class__.__name__}.{sys._getframe().f_code.co_name}'
+        msg = f'{self.__class__.__name__}.ingest_accounts'
         logging.info(msg)
 
         # Wrapper for the results
@@ -782,7 +763,7 @@ class TinkModel:
         containing instances of api.UserResponse with a unique identifier of
         the users {USER_ID}.
         """
-        msg = f'{self.__class__.__name__}.{sys._getframe().f_code.co_name}'
+        msg = f'{self.__class__.__name__}.get_all_accounts'
         logging.info(msg)
 
         # Wrapper for the results
@@ -838,7 +819,7 @@ class TinkModel:
         the user's accounts.
         :raise ExUserNotExisting: in case the user to be deleted does not exist
         """
-        msg = f'{self.__class__.__name__}.{sys._getframe().f_code.co_name}'
+        msg = f'{self.__class__.__name__}.get_user_accounts'
         logging.debug(msg)
 
         # Wrapper for the results
@@ -886,7 +867,7 @@ class TinkModel:
         410	Transaction has already been deleted.
         412	Could not find any accounts for the user.
         """
-        msg = f'{self.__class__.__name__}.{sys._getframe().f_code.co_name}'
+        msg = f'{self.__class__.__name__}.ingest_transactions'
         logging.info(msg)
 
         # Wrapper for the results
@@ -952,7 +933,7 @@ class TinkModel:
 
         :return: TinkModelResult
         """
-        msg = f'{self.__class__.__name__}.{sys._getframe().f_code.co_name}'
+        msg = f'{self.__class__.__name__}.list_transactions'
         logging.info(msg)
 
         # Wrapper for the results
@@ -966,7 +947,7 @@ class TinkModel:
 
         :return: TinkModelResultList
         """
-        msg = f'{self.__class__.__name__}.{sys._getframe().f_code.co_name}'
+        msg = f'{self.__class__.__name__}.list_categories'
         logging.info(msg)
 
         service = api.CategoryService()
@@ -1020,7 +1001,7 @@ class TinkModelResult:
 
         self._action = action
         if self._action == '':
-            self._action = f'{self.__class__.__name__}.{sys._getframe().f_code.co_name}'
+            self._action = f'{self.__class__.__name__}.__init__'
 
         self._msg = msg
         self._is_important = is_important
@@ -1122,7 +1103,7 @@ class TinkModelResultList:
 
         self._action = action
         if self._action == '':
-            self._action = f'{self.__class__.__name__}.{sys._getframe().f_code.co_name}'
+            self._action = f'{self.__class__.__name__}.__init__'
 
         self._msg = msg
 
@@ -8,17 +8,81 @@ import Categorisation.Common.util as utl
 
 import sys
 import os
+import types
 import logging
+import functools
+import itertools
+import contextlib
+import concurrent.futures
 import datetime
-import time
-import traceback
 import tkinter as tk
 import tkinter.scrolledtext as tkst
 
-from tkinter import filedialog
+from tkinter import ttk
 
 
-class TinkUI:
+# Logger of the ui (Logger.isEnabledFor caches its result until the configuration changes)
+_log = logging.getLogger(__name__)
+
+# Default input/output files by kind derived from the file patterns once at import time
+_FILE_KINDS = ('Users', 'Accounts', 'Transactions')
+_IN_FILES = {kind: cfg.IN_FILE_PATTERN_TINK.replace('*', kind) for kind in _FILE_KINDS}
+_OUT_FILES = {kind: cfg.OUT_FILE_PATTERN_TINK.replace('*', kind) for kind in _FILE_KINDS}
+
+# Text widget index of the end of the ui log area (bound once for the hot log paths)
+_TK_END = tk.END
+
+# Message detail levels by their value (the text shown in the option menu)
+_MSG_LEVELS = {e.value: e for e in cfg.MessageDetailLevel}
+
+# Current local time (bound once for the time prefix of the ui log texts)
+_now = datetime.datetime.now
+
+# Line separators appended to the ui log texts indexed by the number of newlines
+# (the Text widget is not a file: it uses '\n' and os.linesep would add a '\r' on Windows)
+_LOG_SEPS = ('', '\n', '\n' * 2)
+
+
+def _traced(tag: str = None, level: int = logging.DEBUG):
+    """
+    Decorator factory logging a static tag whenever the decorated method is invoked.
+    The tag is built once at class definition time instead of formatting the class and
+    method name (via sys._getframe) on every call. Nothing is logged at all if the log
+    level is not enabled.
+
+    :param tag: The text to be logged, by default the (interned) '<class>.<method>'
+                name of the decorated method (__qualname__).
+    :param level: The log level used for the tag.
+    :return: The decorator.
+    """
+    def decorator(func):
+        text = tag or sys.intern(func.__qualname__)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _log.isEnabledFor(level):
+                _log.log(level, text)
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class _TracedMeta(type):
+
+    """
+    Metaclass applying the decorator _traced to all public methods of a class.
+    The tags '<class>.<method>' are built once when the class is created.
+    Non-public methods which should be traced need to be decorated explicitly.
+    """
+
+    def __new__(mcs, name, bases, namespace):
+        for key, value in list(namespace.items()):
+            if isinstance(value, types.FunctionType) and not key.startswith('_'):
+                namespace[key] = _traced(level=logging.INFO)(value)
+        return super().__new__(mcs, name, bases, namespace)
+
+
+class TinkUI(metaclass=_TracedMeta):
 
     """
     This class manages the user interface for the Tink Client application.
@@ -31,6 +95,87 @@ class TinkUI:
 
     TITLE = 'Tink Client Application for API Testing'
     WELCOME_TEXT = 'Tink Client Application started: Please choose an option ...'
+    MAX_LOG_LINES = cfg.UI_LOG_MAX_LINES  # Oldest lines of the ui log area beyond this limit are dropped
+    LOG_TRIM_SLACK = MAX_LOG_LINES // 10  # Lines the ui log area may exceed MAX_LOG_LINES before it is trimmed
+    POLL_INTERVAL_MS = 50  # Interval in which the ui checks for results of background work
+    FILE_CHUNK_ROWS = 500  # Rows of a file written into the ui log area at once (see show_file_content)
+
+    # Buttons of the ui: (action code, style, text) (see _callback). The command buttons are
+    # the ones calling the model.
+    _FILE_IN_BUTTONS = (
+        ('btn_usr_file_in', 'Violet.TButton', 'Show'),
+        ('btn_acc_file_in', 'Violet.TButton', 'Show'),
+        ('btn_trx_file_in', 'Violet.TButton', 'Show'),
+    )
+    _FILE_OUT_BUTTONS = (
+        ('btn_usr_file_out', 'Violet.TButton', 'Show'),
+        ('btn_acc_file_out', 'Violet.TButton', 'Show'),
+        ('btn_trx_file_out', 'Violet.TButton', 'Show'),
+    )
+    _COMMAND_BUTTONS = (
+        ('btn_test', 'Orange.TButton', 'API health checks'),
+        ('btn_list_categories', 'Blue.TButton', 'List categories'),
+        ('btn_activate_users', 'Green.TButton', 'Create user(s)'),
+        ('btn_delete_users', 'Red.TButton', 'Delete user(s)'),
+        ('btn_list_users', 'Blue.TButton', 'List user(s)'),
+        ('btn_ingest_accounts', 'Green.TButton', 'Ingest account(s)'),
+        ('btn_delete_accounts', 'Red.TButton', 'Delete account(s)'),
+        ('btn_list_accounts', 'Blue.TButton', 'List account(s)'),
+        ('btn_ingest_trx', 'Green.TButton', 'Ingest transaction(s)'),
+        ('btn_delete_trx', 'Red.TButton', 'Delete transaction(s)'),
+        ('btn_list_trx', 'Blue.TButton', 'List transaction(s)'),
+        ('btn_process_all', 'Brown.TButton', 'Process all steps'),
+    )
+    _LOG_BUTTONS = (
+        ('btn_save_logs', 'TButton', 'Save logs'),
+        ('btn_clear_logs', 'TButton', 'Clear logs'),
+    )
+
+    # Options shared by all checkbuttons of the config frame
+    _CHECKBUTTON_OPTIONS = dict(onvalue=True, offvalue=False)
+
+    # Grid layout of the ui widgets: (widget name, grid options)
+    _LAYOUT = (
+        # --- File Frame
+        ('txt_usr_file_in', dict(row=1, column=2, sticky=tk.W)),
+        ('txt_acc_file_in', dict(row=2, column=2, sticky=tk.W)),
+        ('txt_trx_file_in', dict(row=3, column=2, sticky=tk.W)),
+        ('btn_usr_file_in', dict(row=1, column=3, sticky=tk.W)),
+        ('btn_acc_file_in', dict(row=2, column=3, sticky=tk.W)),
+        ('btn_trx_file_in', dict(row=3, column=3, sticky=tk.W)),
+        ('txt_usr_file_out', dict(row=1, column=4, sticky=tk.W)),
+        ('txt_acc_file_out', dict(row=2, column=4, sticky=tk.W)),
+        ('txt_trx_file_out', dict(row=3, column=4, sticky=tk.W)),
+        ('btn_usr_file_out', dict(row=1, column=5, sticky=tk.W)),
+        ('btn_acc_file_out', dict(row=2, column=5, sticky=tk.W)),
+        ('btn_trx_file_out', dict(row=3, column=5, sticky=tk.W)),
+
+        # --- Config Frame
+        ('cbtn_delete', dict(row=1, column=1, sticky=tk.W)),
+        ('cbtn_result_file', dict(row=2, column=1, sticky=tk.W)),
+        ('cbtn_proxy', dict(row=1, column=2, sticky=tk.W)),
+        ('txt_proxy', dict(row=1, column=3, sticky=tk.W)),
+
+        # --- Command Frame
+        ('btn_test', dict(row=1, column=1, sticky=tk.W)),
+        ('btn_process_all', dict(row=1, column=2, columnspan=3, sticky=tk.SW)),
+        ('btn_delete_users', dict(row=2, column=1, sticky=tk.W)),
+        ('btn_delete_accounts', dict(row=2, column=2, sticky=tk.W)),
+        ('btn_delete_trx', dict(row=2, column=3, sticky=tk.W)),
+        ('btn_activate_users', dict(row=3, column=1, sticky=tk.W)),
+        ('btn_ingest_accounts', dict(row=3, column=2, sticky=tk.W)),
+        ('btn_ingest_trx', dict(row=3, column=3, sticky=tk.W)),
+        ('btn_list_users', dict(row=4, column=1, sticky=tk.W)),
+        ('btn_list_accounts', dict(row=4, column=2, sticky=tk.W)),
+        ('btn_list_trx', dict(row=4, column=3, sticky=tk.W)),
+        ('btn_list_categories', dict(row=4, column=4, sticky=tk.W)),
+        ('btn_clear_logs', dict(row=5, column=1, sticky=tk.W)),
+        ('btn_save_logs', dict(row=5, column=2, sticky=tk.W)),
+
+        # --- Result Frame
+        ('result_log', dict(row=1, column=1, sticky=tk.W)),
+        ('opt_msg_level_det', dict(row=2, column=1, sticky=tk.W)),
+    )
 
     def __init__(self, model_facade):
         """
@@ -50,14 +195,33 @@ class TinkUI:
         if not isinstance(model_facade, model.TinkModel):
             self._model = model_facade.TinkModel(data.TinkDAO)
 
+        # Worker threads for blocking model calls and log saves (keeps the Tk mainloop
+        # responsive): Model calls run one at a time, a log save may run alongside
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
+        # Texts waiting to be written into the ui log area with the next idle flush
+        self._log_buffer: list[str] = []
+        self._log_flush_pending = False
+        self._log_scroll_pending = False
+        self._log_clear_pending = False
+        self._log_generation = 0  # Incremented by every clear (ends streams into the ui log area)
+
+        # Last time prefix of the ui log area: (time, formatted prefix)
+        self._log_stamp = (None, '')
+
+        # Last save of the ui log area: (file name, version) where the version consists of
+        # modification time and size of the file written (see _save_result_log)
+        self._log_saved = None
+
         # --- Windows
         self.window = tk.Tk()
+        self.window.withdraw()  # Hidden until all widgets are placed (see end of __init__)
         self.window.title(TinkUI.TITLE)
+        self.window.protocol('WM_DELETE_WINDOW', self._close)
         self.window.grid_rowconfigure(1, weight=1)
         self.window.grid_columnconfigure(0, weight=1)
 
         # --- Frames: Widgets
-        self.frm_header = tk.Frame(master=self.window, padx=5, pady=5)
         self.frm_file = tk.Frame(master=self.window, padx=5, pady=5)
         self.frm_config = tk.Frame(master=self.window, padx=5, pady=5)
         self.frm_command = tk.Frame(master=self.window, padx=5, pady=5)
@@ -70,188 +234,111 @@ class TinkUI:
         self.frm_result.grid(row=4, sticky=tk.NW)
 
         # --- Variables to hold widget data
+        self.txt_usr_file_in_val = tk.StringVar(value=_IN_FILES['Users'])
+        self.txt_acc_file_in_val = tk.StringVar(value=_IN_FILES['Accounts'])
+        self.txt_trx_file_in_val = tk.StringVar(value=_IN_FILES['Transactions'])
+        self.txt_usr_file_out_val = tk.StringVar(value=_OUT_FILES['Users'])
+        self.txt_acc_file_out_val = tk.StringVar(value=_OUT_FILES['Accounts'])
+        self.txt_trx_file_out_val = tk.StringVar(value=_OUT_FILES['Transactions'])
+        self.txt_proxy_val = tk.StringVar(value=cfg.PROXY_URL + ':' + cfg.PROXY_PORT)
         self.cbtn_result_file_val = tk.BooleanVar()
         self.cbtn_proxy_val = tk.BooleanVar()
         self.cbtn_delete_val = tk.BooleanVar()
         self.opt_msg_level_det_val = tk.StringVar()
 
+        # --- Variable traces: File and checkbox changes are pushed into the configuration directly
+        self._trace_config(self.txt_usr_file_in_val, 'user_source')
+        self._trace_config(self.txt_acc_file_in_val, 'account_source')
+        self._trace_config(self.txt_trx_file_in_val, 'transaction_source')
+        self._trace_config(self.txt_usr_file_out_val, 'user_target')
+        self._trace_config(self.txt_acc_file_out_val, 'account_target')
+        self._trace_config(self.txt_trx_file_out_val, 'transaction_target')
+        self._trace_config(self.cbtn_result_file_val, 'result_file_flag')
+        self._trace_config(self.cbtn_delete_val, 'delete_flag')
+        self._trace_config(self.cbtn_proxy_val, 'proxy_flag')
+
         # --- UI widgets and Layout
+        self._styles()
         self._widgets()
         self._layout()
+        self._actions = self._action_table()
 
         # --- UI Data Initialization and Synchronization
         self._data_init()
         self._data_sync()
 
+        # --- Show the window with its final geometry
+        self.window.update_idletasks()
+        self.window.deiconify()
+
+    def _styles(self):
+        """
+        Setup the ttk styles shared by the ui widgets. Each style is configured once
+        and then referenced by name instead of passing colours to every widget.
+        :return: Void
+        """
+        style = ttk.Style(master=self.window)
+        for colour in ('violet', 'orange', 'blue', 'green', 'red', 'brown'):
+            style.configure(f'{colour.capitalize()}.TButton', foreground=colour)
+
     def _widgets(self):
         """
         Setup the ui widgets.
         :return: Void
         """
-        # --- File Frame: Input Files - Text Fields
-        self.txt_usr_file_in = tk.Entry(master=self.frm_file,
-                                        width=40,
-                                        state='normal')
-
-        self.txt_acc_file_in = tk.Entry(master=self.frm_file,
-                                        width=40,
-                                        state='normal')
+        # All buttons by their action code (see _callback)
+        self._buttons: dict[str, ttk.Button] = dict()
 
-        self.txt_trx_file_in = tk.Entry(master=self.frm_file,
-                                        width=40,
-                                        state='normal')
+        # --- File Frame: Input Files - Text Fields
+        self.txt_usr_file_in = self._file_entry(self.txt_usr_file_in_val)
+        self.txt_acc_file_in = self._file_entry(self.txt_acc_file_in_val)
+        self.txt_trx_file_in = self._file_entry(self.txt_trx_file_in_val)
 
         # --- File Frame: Input Files - Action Buttons
-        self.btn_usr_file_in = tk.Button(master=self.frm_file,
-                                         fg='violet',
-                                         text='Show',
-                                         command=lambda: self._callback('btn_usr_file_in'))
-
-        self.btn_acc_file_in = tk.Button(master=self.frm_file,
-                                         fg='violet',
-                                         text='Show',
-                                         command=lambda: self._callback('btn_acc_file_in'))
-
-        self.btn_trx_file_in = tk.Button(master=self.frm_file,
-                                         fg='violet',
-                                         text='Show',
-                                         command=lambda: self._callback('btn_trx_file_in'))
+        self._create_buttons(self.frm_file, TinkUI._FILE_IN_BUTTONS)
 
         # --- File Frame: Output Files - Text Fields
-        self.txt_usr_file_out = tk.Entry(master=self.frm_file,
-                                         width=40,
-                                         state='normal')
-
-        self.txt_acc_file_out = tk.Entry(master=self.frm_file,
-                                         width=40,
-                                         state='normal')
-
-        self.txt_trx_file_out = tk.Entry(master=self.frm_file,
-                                         width=40,
-                                         state='normal')
+        self.txt_usr_file_out = self._file_entry(self.txt_usr_file_out_val)
+        self.txt_acc_file_out = self._file_entry(self.txt_acc_file_out_val)
+        self.txt_trx_file_out = self._file_entry(self.txt_trx_file_out_val)
 
         # --- File Frame: Output Files - Action Buttons
-        self.btn_usr_file_out = tk.Button(master=self.frm_file,
-                                          fg='violet',
-                                          text='Show',
-                                          command=lambda: self._callback('btn_usr_file_out'))
+        self._create_buttons(self.frm_file, TinkUI._FILE_OUT_BUTTONS)
 
-        self.btn_acc_file_out = tk.Button(master=self.frm_file,
-                                          fg='violet',
-                                          text='Show',
-                                          command=lambda: self._callback('btn_acc_file_out'))
+        # --- Config Frame: Checkboxes
+        self.cbtn_result_file = ttk.Checkbutton(master=self.frm_config,
+                                                text='Write results into files',
+                                                variable=self.cbtn_result_file_val,
+                                                **TinkUI._CHECKBUTTON_OPTIONS)
 
-        self.btn_trx_file_out = tk.Button(master=self.frm_file,
-                                          fg='violet',
-                                          text='Show',
-                                          command=lambda: self._callback('btn_trx_file_out'))
+        self.cbtn_delete = ttk.Checkbutton(master=self.frm_config,
+                                           text='Delete existing data',
+                                           variable=self.cbtn_delete_val,
+                                           **TinkUI._CHECKBUTTON_OPTIONS)
 
-        # --- Config Frame: Checkboxes
-        self.cbtn_result_file = tk.Checkbutton(self.frm_config,
-                                               onvalue=True,
-                                               offvalue=False,
-                                               text='Write results into files',
-                                               variable=self.cbtn_result_file_val,
-                                               command=lambda: self._callback('cbtn_result_file'))
-
-        self.cbtn_delete = tk.Checkbutton(self.frm_config,
-                                          onvalue=True,
-                                          offvalue=False,
-                                          text='Delete existing data',
-                                          variable=self.cbtn_delete_val,
-                                          command=lambda: self._callback('cbtn_delete'))
-
-        self.cbtn_proxy = tk.Checkbutton(master=self.frm_config,
-                                         onvalue=True,
-                                         offvalue=False,
-                                         text='Use HTTP proxy',
-                                         variable=self.cbtn_proxy_val,
-                                         command=lambda: self._callback('cbtn_proxy'))
-        self.cbtn_delete.grid(row=1, column=1, sticky=tk.W)
+        self.cbtn_proxy = ttk.Checkbutton(master=self.frm_config,
+                                          text='Use HTTP proxy',
+                                          variable=self.cbtn_proxy_val,
+                                          **TinkUI._CHECKBUTTON_OPTIONS)
 
         # --- Config Frame: Text Widgets
 
-        self.txt_proxy = tk.Entry(self.frm_config, width=30)
+        self.txt_proxy = tk.Entry(self.frm_config,
+                                  width=30,
+                                  state='readonly',
+                                  textvariable=self.txt_proxy_val)
 
         # --- Command Frame: Button Widgets
 
-        self.btn_test = tk.Button(master=self.frm_command,
-                                  fg='orange',
-                                  text='API health checks',
-                                  command=lambda: self._callback('btn_test'))
-
-        self.btn_list_categories = tk.Button(master=self.frm_command,
-                                             fg='blue',
-                                             text='List categories',
-                                             command=lambda: self._callback('btn_list_categories'))
-
-        self.btn_activate_users = tk.Button(master=self.frm_command,
-                                            fg='green',
-                                            text='Create user(s)',
-                                            command=lambda: self._callback('btn_activate_users'))
-
-        self.btn_delete_users = tk.Button(master=self.frm_command,
-                                          fg='red',
-                                          text='Delete user(s)',
-                                          command=lambda: self._callback('btn_delete_users'))
-
-        self.btn_list_users = tk.Button(master=self.frm_command,
-                                        fg='blue',
-                                        text='List user(s)',
-                                        command=lambda: self._callback('btn_list_users'))
-
-        self.btn_ingest_accounts = tk.Button(master=self.frm_command,
-                                             fg='green',
-                                             text='Ingest account(s)',
-                                             command=lambda: self._callback('btn_ingest_accounts'))
-
-        self.btn_delete_accounts = tk.Button(master=self.frm_command,
-                                             fg='red',
-                                             text='Delete account(s)',
-                                             command=lambda: self._callback('btn_delete_accounts'))
-
-        self.btn_list_accounts = tk.Button(master=self.frm_command,
-                                           fg='blue',
-                                           text='List account(s)',
-                                           command=lambda: self._callback('btn_list_accounts'))
-
-        self.btn_ingest_trx = tk.Button(master=self.frm_command,
-                                        fg='green',
-                                        text='Ingest transaction(s)',
-                                        command=lambda: self._callback('btn_ingest_trx'))
-
-        self.btn_delete_trx = tk.Button(master=self.frm_command,
-                                        fg='red',
-                                        text='Delete transaction(s)',
-                                        command=lambda: self._callback('btn_delete_trx'))
-
-        self.btn_list_trx = tk.Button(master=self.frm_command,
-                                      fg='blue',
-                                      text='List transaction(s)',
-                                      command=lambda: self._callback('btn_list_trx'))
-
-        self.btn_process_all = tk.Button(master=self.frm_command,
-                                         fg='brown',
-                                         text='Process all steps',
-                                         command=lambda: self._callback('btn_process_all'))
-
-        self.btn_save_logs = tk.Button(master=self.frm_command,
-                                       text='Save logs',
-                                       command=lambda: self._callback('btn_save_logs'))
-
-        self.btn_clear_logs = tk.Button(master=self.frm_command,
-                                        text='Clear logs',
-                                        command=lambda: self._callback('btn_clear_logs'))
+        self._create_buttons(self.frm_command, TinkUI._COMMAND_BUTTONS)
+        self._create_buttons(self.frm_command, TinkUI._LOG_BUTTONS)
 
         # --- Result Frame: Button Widgets
 
-        dropdown_choices = list()
-        for e in cfg.MessageDetailLevel:
-            dropdown_choices.append(e.value)
-        self.opt_msg_level_det_val.set(dropdown_choices[0])
+        self.opt_msg_level_det_val.set(next(iter(_MSG_LEVELS)))
         self.opt_msg_level_det = tk.OptionMenu(self.frm_result,
                                                self.opt_msg_level_det_val,
-                                               *dropdown_choices,
+                                               *_MSG_LEVELS,
                                                command=self._callback_option_button)
 
         # --- Result Frame: Text Widgets
@@ -261,54 +348,47 @@ class TinkUI:
             wrap=tk.WORD,
             width=cfg.UI_STRING_MAX_WITH,
             height=15,
-            bg='beige')
+            bg='beige',
+            state='disabled')
+
+    def _create_buttons(self, master, specs):
+        """
+        Create the buttons of a frame from a button table (see e.g. _COMMAND_BUTTONS).
+        The command of each button dispatches its action code to _callback.
+        :param master: The frame holding the buttons.
+        :param specs: Tuple of (action code, style, text) entries.
+        :return: Void
+        """
+        for code, style, text in specs:
+            self._buttons[code] = ttk.Button(master=master,
+                                             style=style,
+                                             text=text,
+                                             command=functools.partial(self._callback, code))
+
+    def _file_entry(self, var: tk.StringVar):
+        """
+        Create a text field of the file frame showing a file name.
+        :param var: The variable holding the file name.
+        :return: The tk.Entry widget.
+        """
+        return tk.Entry(master=self.frm_file, width=40, state='normal', textvariable=var)
 
     def _layout(self):
         """
-        Setup the layout of the ui widgets using a grid layout.
+        Setup the layout of the ui widgets using a grid layout (see _LAYOUT).
         :return: Void.
         """
-        # --- File Frame: Layout
-        self.txt_usr_file_in.grid(row=1, column=2, sticky=tk.W)
-        self.txt_acc_file_in.grid(row=2, column=2, sticky=tk.W)
-        self.txt_trx_file_in.grid(row=3, column=2, sticky=tk.W)
-        self.btn_usr_file_in.grid(row=1, column=3, sticky=tk.W)
-        self.btn_acc_file_in.grid(row=2, column=3, sticky=tk.W)
-        self.btn_trx_file_in.grid(row=3, column=3, sticky=tk.W)
-
-        self.txt_usr_file_out.grid(row=1, column=4, sticky=tk.W)
-        self.txt_acc_file_out.grid(row=2, column=4, sticky=tk.W)
-        self.txt_trx_file_out.grid(row=3, column=4, sticky=tk.W)
-        self.btn_usr_file_out.grid(row=1, column=5, sticky=tk.W)
-        self.btn_acc_file_out.grid(row=2, column=5, sticky=tk.W)
-        self.btn_trx_file_out.grid(row=3, column=5, sticky=tk.W)
-
-        # --- Config Frame: Layout
-        self.cbtn_delete.grid(row=1, column=1, sticky=tk.W)
-        self.cbtn_result_file.grid(row=2, column=1, sticky=tk.W)
-
-        self.cbtn_proxy.grid(row=1, column=2, sticky=tk.W)
-        self.txt_proxy.grid(row=1, column=3, sticky=tk.W)
-
-        # --- Command Frame Layout
-        self.btn_test.grid(row=1, column=1, sticky=tk.W)
-        self.btn_process_all.grid(row=1, column=2, columnspan=3, sticky=tk.SW)
-        self.btn_delete_users.grid(row=2, column=1, sticky=tk.W)
-        self.btn_delete_accounts.grid(row=2, column=2, sticky=tk.W)
-        self.btn_delete_trx.grid(row=2, column=3, sticky=tk.W)
-        self.btn_activate_users.grid(row=3, column=1, sticky=tk.W)
-        self.btn_ingest_accounts.grid(row=3, column=2, sticky=tk.W)
-        self.btn_ingest_trx.grid(row=3, column=3, sticky=tk.W)
-        self.btn_list_users.grid(row=4, column=1, sticky=tk.W)
-        self.btn_list_accounts.grid(row=4, column=2, sticky=tk.W)
-        self.btn_list_trx.grid(row=4, column=3, sticky=tk.W)
-        self.btn_list_categories.grid(row=4, column=4, sticky=tk.W)
-        self.btn_clear_logs.grid(row=5, column=1, sticky=tk.W)
-        self.btn_save_logs.grid(row=5, column=2, sticky=tk.W)
-
-        # --- Result Frame Layout
-        self.result_log.grid(row=1, column=1, sticky=tk.W)
-        self.opt_msg_level_det.grid(row=2, column=1, sticky=tk.W)
+        for name, options in TinkUI._LAYOUT:
+            self._widget(name).grid(**options)
+
+    def _widget(self, name: str):
+        """
+        Get a ui widget by its name.
+        :param name: The name of the widget (action code for buttons, attribute name otherwise).
+        :return: The widget.
+        """
+        return self._buttons[name] if name in self._buttons else getattr(self, name)
+
     def _data_sync(self):
         """
         Synchronization of the data held in the ui components e.g. with the global
@@ -316,18 +396,9 @@ class TinkUI:
 
         :return: void
         """
-        cfg.TinkConfig.get_instance().user_source = self.txt_usr_file_in.get()
-        cfg.TinkConfig.get_instance().account_source = self.txt_acc_file_in.get()
-        cfg.TinkConfig.get_instance().transaction_source = self.txt_trx_file_in.get()
-
-        cfg.TinkConfig.get_instance().user_target = self.txt_usr_file_out.get()
-        cfg.TinkConfig.get_instance().account_target = self.txt_acc_file_out.get()
-        cfg.TinkConfig.get_instance().transaction_target = self.txt_trx_file_out.get()
-
-        cfg.TinkConfig.get_instance().delete_flag = self.cbtn_delete_val.get()
-        cfg.TinkConfig.get_instance().proxy_flag = self.cbtn_proxy_val.get()
-        cfg.TinkConfig.get_instance().result_file_flag = self.cbtn_result_file_val.get()
-        cfg.TinkConfig.get_instance().message_detail_level = self.opt_msg_level_det_val.get()
+        # Files and flags are kept in sync by variable traces (see _trace_config)
+        config = cfg.TinkConfig.get_instance()
+        config.message_detail_level = _MSG_LEVELS[self.opt_msg_level_det_val.get()]
 
     def _data_init(self):
         """
@@ -335,27 +406,25 @@ class TinkUI:
 
         :return: Void.
         """
-        file = cfg.IN_FILE_PATTERN_TINK.replace('*', 'Users')
-        self.txt_usr_file_in.insert(0, file)
-        self.txt_usr_file_out.insert(0, file.replace('In', 'Out'))
-
-        file = cfg.IN_FILE_PATTERN_TINK.replace('*', 'Accounts')
-        self.txt_acc_file_in.insert(0, file)
-        self.txt_acc_file_out.insert(0, file.replace('In', 'Out'))
+        # CheckButtons (the input/output files are initialized with their variables)
+        self.cbtn_delete_val.set(True)  # Pre-delete is enabled by default
+        self.cbtn_result_file_val.set(True)  # Write results into a file by default
+        self.cbtn_proxy_val.set(False)  # Proxy usage is disabled by default
 
-        file = cfg.IN_FILE_PATTERN_TINK.replace('*', 'Transactions')
-        self.txt_trx_file_in.insert(0, file)
-        self.txt_trx_file_out.insert(0, file.replace('In', 'Out'))
+        self._put_result_log(text=TinkUI.WELCOME_TEXT, nl=2, time=False)
 
-        # CheckButtons
-        self.cbtn_delete.select()  # Pre-delete is enabled by default
-        self.cbtn_result_file.select()  # Write results into a file by default
-        self.cbtn_proxy.deselect()  # Proxy usage is disabled by default
+    def _trace_config(self, var: tk.Variable, attr: str):
+        """
+        Keep a property of the configuration Singleton config.TinkConfig in sync with
+        a widget variable. The current value is pushed right away and then whenever the
+        variable is written which makes reading the variable back obsolete.
 
-        self.txt_proxy.config(state='normal')
-        self.txt_proxy.insert(0, cfg.PROXY_URL + ':' + cfg.PROXY_PORT)
-        self.txt_proxy.config(state='readonly')
-        self._put_result_log(text=TinkUI.WELCOME_TEXT, nl=2, time=False)
+        :param var: The widget variable (e.g. tk.BooleanVar) to be observed.
+        :param attr: The name of the config.TinkConfig property to be updated.
+        :return: Void.
+        """
+        setattr(cfg.TinkConfig.get_instance(), attr, var.get())
+        var.trace_add('write', lambda *_: setattr(cfg.TinkConfig.get_instance(), attr, var.get()))
 
     def _put_result_log(self, text: str, clear=False, nl: int = 1, time=True, scroll=False):
         """
@@ -372,24 +441,177 @@ class TinkUI:
         if clear:
             self._clear_result_log()
 
-        if time:
-            date_time = utl.strdate(datetime.datetime.now()) + ': '
-        else:
-            date_time = ''
+        date_time = self._log_timestamp() if time else ''
+
+        sep = _LOG_SEPS[nl] if nl < len(_LOG_SEPS) else '\n' * nl
 
-        self.result_log.insert(tk.INSERT, date_time + text + os.linesep * nl)
+        # Writes are collected and flushed into the widget once the ui gets idle. The parts
+        # are buffered as they are, the flush joins them in one go for its single insert.
+        self._log_buffer.extend((date_time, text, sep))
+        self._log_scroll_pending = self._log_scroll_pending or scroll
+        self._schedule_result_log_flush()
 
-        if scroll:
-            self.result_log.see(tk.END)
+    def _put_banner(self, title: str, nl: int = 1):
+        """
+        Clear the output (in the ui log area) and write a title line without time.
+        :param title: The title e.g. of an action.
+        :param nl: Number of newlines between the title and the following text.
+        :return: Void
+        """
+        self._put_result_log('*** ' + title + ' ***', clear=True, nl=nl, time=False)
+
+    def _schedule_result_log_flush(self):
+        """
+        Schedule the flush of the output (in the ui log area) for the next idle time
+        unless it is already pending.
+        :return: Void
+        """
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            self.window.after_idle(self._flush_result_log)
+
+    def _log_timestamp(self):
+        """
+        Get the time prefix for a line of the output (in the ui log area). The prefix has a
+        resolution of seconds and is therefore only formatted once per second.
+        :return: The formatted current time followed by ': '.
+        """
+        now = _now().replace(microsecond=0)
+
+        if self._log_stamp[0] != now:
+            self._log_stamp = (now, utl.strdate(now) + ': ')
 
-        self.result_log.update()
+        return self._log_stamp[1]
+
+    def _flush_result_log(self):
+        """
+        Write all buffered texts into the output (in the ui log area) using a single
+        insert and scroll and redraw at most once per flush. A pending clear is applied
+        right before the insert so both are drawn together.
+        :return: Void
+        """
+        self._log_flush_pending = False
+
+        if self._log_buffer or self._log_clear_pending:
+            text = ''.join(self._log_buffer)
+            self._log_buffer.clear()
+
+            with self._result_log_writable():
+                if self._log_clear_pending:
+                    self._log_clear_pending = False
+                    self.result_log.delete(1.0, _TK_END)
+                self.result_log.insert(_TK_END, text)
+                self._trim_result_log()
+
+        if self._log_scroll_pending:
+            self._log_scroll_pending = False
+            self.result_log.yview_moveto(1.0)
+
+        # Redraw once per flush (update() would also process events and may re-enter callbacks)
+        self.result_log.update_idletasks()
+
+    def _trim_result_log(self):
+        """
+        Drop the oldest lines of the output (in the ui log area) in one go once it holds
+        more than MAX_LOG_LINES + LOG_TRIM_SLACK lines, keeping the last MAX_LOG_LINES lines.
+        The slack makes the delete happen once per LOG_TRIM_SLACK lines instead of on every
+        flush while keeping the cost of inserting, saving and clearing the text bounded.
+        :return: Void
+        """
+        lines = int(self.result_log.index('end-1c').split('.')[0])
+        if lines > TinkUI.MAX_LOG_LINES + TinkUI.LOG_TRIM_SLACK:
+            self.result_log.delete(1.0, f'{lines - TinkUI.MAX_LOG_LINES + 1}.0')
+            self._log_saved = None  # The saved text is no longer the head of the log area
 
     def _clear_result_log(self):
         """
-        Clear the output (in the ui log area).
+        Clear the output (in the ui log area). The widget is cleared with the next flush
+        together with the texts written after the clear.
+        :return: Void
+        """
+        self._log_buffer.clear()
+        self._log_clear_pending = True
+        self._log_generation += 1
+        self._log_saved = None
+        self._schedule_result_log_flush()
+
+    def _save_result_log(self):
+        """
+        Save the output (in the ui log area) into a file selected by the user.
+        Saving into the same file again does only append the text logged since the last
+        save as long as the file is unchanged since then (same modification time and size)
+        and no lines have been trimmed from the log area meanwhile. The file then ends up
+        the same as if it was replaced (as confirmed by the user in the dialog). The position
+        of the last save is tracked by the text mark 'saved'. The text is taken from the log
+        area in the ui thread while the file is written in a worker thread.
+        :return: Void
+        """
+        self._flush_result_log()
+
+        file_name = utl.ask_save_file_name()
+        if file_name == '':
+            return
+
+        version = self._file_version(file_name)
+        append = version is not None and self._log_saved == (file_name, version)
+        start = 'saved' if append else 1.0
+
+        text = self.result_log.get(start, 'end-1c')
+
+        # Left gravity keeps the mark in front of text appended afterwards
+        self.result_log.mark_set('saved', 'end-1c')
+        self.result_log.mark_gravity('saved', tk.LEFT)
+        self._log_saved = (file_name, None)  # Pending until the file has been written
+
+        self._run_async(utl.write_to_file, file_name, text, append,
+                        on_done=functools.partial(self._show_save_result, file_name),
+                        widgets=(self._buttons['btn_save_logs'],))
+
+    def _show_save_result(self, file_name, future: concurrent.futures.Future):
+        """
+        Record the version of the file the output (in the ui log area) has been saved into
+        or report the failure of saving it (the next save does then write the whole log
+        area again).
+        :param file_name: The name of the file written.
+        :param future: The completed future of the file write.
+        :return: Void
+        """
+        try:
+            future.result()
+            # Unless the log area has been cleared or trimmed meanwhile
+            if self._log_saved == (file_name, None):
+                self._log_saved = (file_name, self._file_version(file_name))
+        except Exception as e:
+            self._log_saved = None
+            self._put_result_log(f'Saving the logs failed: {str(e)}')
+            _log.debug('Saving the logs failed', exc_info=True)
+
+    @staticmethod
+    def _file_version(filename):
+        """
+        Get the version of a file consisting of its modification time and size.
+        :param filename: The name of the file.
+        :return: Tuple (modification time in ns, size) or None if the file cannot be accessed.
+        """
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @contextlib.contextmanager
+    def _result_log_writable(self):
+        """
+        Context manager enabling the ui log area for modifications. The log area is
+        read-only (disabled) otherwise which also spares Tk from processing edits and
+        redraws triggered by the user in between two writes.
         :return: Void
         """
-        self.result_log.delete(1.0, tk.END)
+        self.result_log.configure(state='normal')
+        try:
+            yield
+        finally:
+            self.result_log.configure(state='disabled')
 
     def _run(self):
         """
@@ -399,89 +621,92 @@ class TinkUI:
         """
         self.window.mainloop()
 
+    def _close(self):
+        """
+        Close the main window. Pending model calls are cancelled and running ones are not
+        waited for, so that closing the window does not block on the worker threads.
+
+        :return: void
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.window.destroy()
+
     # --- Event Handler
 
+    @_traced()
     def _callback(self, code: str, event=None):
         """
         Generic action dispatcher that can be used for any kind of ui events.
         :param code: Unique action code which should be the name of the button.
         :return: Void.
         """
-        logging.debug(f'{self.__class__.__name__}.{sys._getframe().f_code.co_name}')
-        logging.info(code)
-
-        config = cfg.TinkConfig.get_instance()
+        _log.info(code)
 
         if not code:
             return
-        # Checkbox Actions
-        elif code == 'cbtn_result_file':
-            config.result_file_flag = self.cbtn_result_file_val.get()
-        elif code == 'cbtn_delete':
-            config.delete_flag = self.cbtn_delete_val.get()
-        elif code == 'cbtn_proxy':
-            config.proxy_flag = self.cbtn_proxy_val.get()
-        # Button Actions
-        elif code == 'btn_usr_file_in':
-            self.show_file_content(self.txt_usr_file_in.get())
-        elif code == 'btn_usr_file_out':
-            self.show_file_content(self.txt_usr_file_out.get())
-        elif code == 'btn_acc_file_in':
-            self.show_file_content(self.txt_acc_file_in.get())
-        elif code == 'btn_acc_file_out':
-            self.show_file_content(self.txt_acc_file_out.get())
-        elif code == 'btn_trx_file_in':
-            self.show_file_content(self.txt_trx_file_in.get())
-        elif code == 'btn_trx_file_out':
-            self.show_file_content(self.txt_trx_file_out.get())
-        elif code == 'btn_test':
-            self.call_model(action='API Health Checks',
-                            method=self._model.test_connectivity)
-        elif code == 'btn_activate_users':
-            self.call_model(action='Create/Activate Users',
-                            method=self._model.activate_users)
-        elif code == 'btn_delete_users':
-            self.call_model(action='Delete Users',
-                            method=self._model.delete_users)
-        elif code == 'btn_list_users':
-            self.call_model(action='Get/List Users',
-                            method=self._model.get_users)
-        elif code == 'btn_ingest_accounts':
-            self.call_model(action='Ingest Accounts',
-                            method=self._model.ingest_accounts)
-        elif code == 'btn_delete_accounts':
-            self.call_model(action='Delete Accounts',
-                            method=None)
-        elif code == 'btn_list_accounts':
-            self.call_model(action='Get/List Accounts',
-                            method=self._model.get_all_accounts)
-        elif code == 'btn_ingest_trx':
-            self.call_model(action='Ingest Transactions',
-                            method=self._model.ingest_transactions)
-        elif code == 'btn_delete_trx':
-            self.call_model(action='Delete Transactions',
-                            method=None)
-        elif code == 'btn_list_trx':
-            self.call_model(action='Get/List Transactions',
-                            method=None)
-        elif code == 'btn_process_all':
-            self.call_model_process_actions()
-        elif code == 'btn_list_categories':
-            # self.call_model(action='Get/List Categories',
-            #                 method=self._model.list_categories)
-            self._put_result_log(text='*** List categories ***',
-                                 clear=True,
-                                 time=False,
-                                 nl=2)
-            rl: model.TinkModelResultList = self._model.list_categories()
-            r = rl.first()
-            self._put_result_log(r.response.to_string_custom())
-
-        elif code == 'btn_save_logs':
-            utl.save_to_file(self.result_log.get(1.0, tk.END))
-        elif code == 'btn_clear_logs':
-            self._clear_result_log()
 
+        action = self._actions.get(code)
+        if action:
+            action()
+
+    def _action_table(self):
+        """
+        Build the table of the button actions dispatched by _callback.
+        :return: Dictionary mapping the action codes to functions without arguments.
+        """
+        partial = functools.partial
+        show = self.show_file_content
+        call = self.call_model
+        mdl = self._model
+
+        return {
+            # File Frame
+            'btn_usr_file_in': lambda: show(self.txt_usr_file_in_val.get()),
+            'btn_usr_file_out': lambda: show(self.txt_usr_file_out_val.get()),
+            'btn_acc_file_in': lambda: show(self.txt_acc_file_in_val.get()),
+            'btn_acc_file_out': lambda: show(self.txt_acc_file_out_val.get()),
+            'btn_trx_file_in': lambda: show(self.txt_trx_file_in_val.get()),
+            'btn_trx_file_out': lambda: show(self.txt_trx_file_out_val.get()),
+            # Command Frame
+            'btn_test': partial(call, action='API Health Checks', method=mdl.test_connectivity),
+            'btn_activate_users': partial(call, action='Create/Activate Users', method=mdl.activate_users),
+            'btn_delete_users': partial(call, action='Delete Users', method=mdl.delete_users),
+            'btn_list_users': partial(call, action='Get/List Users', method=mdl.get_users),
+            'btn_ingest_accounts': partial(call, action='Ingest Accounts', method=mdl.ingest_accounts),
+            'btn_delete_accounts': partial(call, action='Delete Accounts', method=None),
+            'btn_list_accounts': partial(call, action='Get/List Accounts', method=mdl.get_all_accounts),
+            'btn_ingest_trx': partial(call, action='Ingest Transactions', method=mdl.ingest_transactions),
+            'btn_delete_trx': partial(call, action='Delete Transactions', method=None),
+            'btn_list_trx': partial(call, action='Get/List Transactions', method=None),
+            'btn_process_all': self.call_model_process_actions,
+            'btn_list_categories': self._list_categories,
+            'btn_save_logs': self._request_save_result_log,
+            'btn_clear_logs': self._clear_result_log,
+        }
+
+    def _list_categories(self):
+        """
+        List the categories supported by Tink.
+        The buttons writing into the ui log area are disabled while the categories are listed.
+        :return: Void.
+        """
+        # self.call_model(action='Get/List Categories',
+        #                 method=self._model.list_categories)
+        self._put_banner('List categories', nl=2)
+        self._run_async(self._model.list_categories,
+                        on_done=self._show_categories,
+                        widgets=self._busy_widgets())
+
+    def _request_save_result_log(self):
+        """
+        Save the output (in the ui log area) once pending repaints are done, because the
+        modal file dialog blocks the event loop (see _save_result_log).
+        :return: Void.
+        """
+        self.window.update_idletasks()
+        self.window.after_idle(self._save_result_log)
+
+    @_traced()
     def _callback_option_button(self, event=None):
         """
         Event Handler for events raised by an OptionButton.
@@ -492,85 +717,226 @@ class TinkUI:
         :param event: Will contain the value of the OptionButton.
         :return: Void.
         """
-        logging.debug(f'{self.__class__.__name__}.{sys._getframe().f_code.co_name}')
-
-        for enum_val in cfg.MessageDetailLevel:
-            if enum_val.value == event:
-                cfg.TinkConfig.get_instance().message_detail_level = enum_val
+        enum_val = _MSG_LEVELS.get(event)
+        if enum_val:
+            cfg.TinkConfig.get_instance().message_detail_level = enum_val
 
     def call_model(self, action: str, method, filters=None):
         """
         Generic method to call a method in the facade module model.
+        The method is executed in a worker thread in order to keep the ui responsive.
+        The buttons writing into the ui log area are disabled meanwhile, so that the result
+        always ends up below the title of its action.
         :param action: A text describing the action performed. The chosen
         text will also be displayed on top of the ui result log.
         :param method: Reference to the method model.* that should be invoked.
         :param filters: dictionary with filters to be applied to the results
         :return: Void.
         """
-        msg = f'{self.__class__.__name__}.{sys._getframe().f_code.co_name}'
-        logging.info(msg)
-
         if not method:
             self._put_result_log(text=f'Action {action} is not yet implemented!',
                                  clear=True,
                                  time=False)
             return
 
-        self._put_result_log(text=f'*** {action} ***',
-                             clear=True,
-                             time=False,
-                             nl=2)
-        logging.info(f'Action: {action} => Trying to dynamically invoke method {method}')
+        self._put_banner(action, nl=2)
+        _log.info('Action: %s => Trying to dynamically invoke method %s', action, method)
+
+        self._run_async(method,
+                        on_done=lambda f: self._show_model_result(method, f),
+                        widgets=self._busy_widgets())
 
+    def _show_model_result(self, method, future: concurrent.futures.Future):
+        """
+        Display the outcome of a model method which was executed in a worker thread.
+        :param method: Reference to the method model.* that has been invoked.
+        :param future: The completed future wrapping the model.TinkModelResultList.
+        :return: Void.
+        """
         rl: model.TinkModelResultList = None
         try:
-            rl: model.TinkModelResultList = method()
+            rl: model.TinkModelResultList = future.result()
         except Exception as e:
             error_text = f'Exception {type(e)}:\n{str(e)}'
             self._put_result_log(error_text)
-            traceback.print_exc()
+            _log.debug('Model call %s failed', method.__name__, exc_info=True)
 
         if rl:
-            filters = self._model.supported_action_filters(method)
-            self._put_result_log(rl.summary(filters=filters))
+            self._render_result(rl, filters=self._model.supported_action_filters(method))
+
+    def _render_result(self, rl, filters=None, nl: int = 1):
+        """
+        Display the summary of a model result list.
+        :param rl: The model.TinkModelResultList to be displayed.
+        :param filters: The output filters of the action that produced the result list.
+        :param nl: Number of newlines between the current text and the summary.
+        :return: Void.
+        """
+        self._put_result_log(rl.summary(filters=filters), nl=nl)
+
+    def _show_categories(self, future: concurrent.futures.Future):
+        """
+        Display the categories listed by a model method executed in a worker thread.
+        :param future: The completed future wrapping the model.TinkModelResultList.
+        :return: Void.
+        """
+        try:
+            rl: model.TinkModelResultList = future.result()
+            self._put_result_log(rl.first().response.to_string_custom())
+        except Exception as e:
+            self._put_result_log(f'Exception {type(e)}:\n{str(e)}')
+            _log.debug('Listing the categories failed', exc_info=True)
+
+    def _busy_widgets(self):
+        """
+        Get the buttons to be disabled while a model call is running: The command buttons
+        as well as the buttons showing files and clearing the logs, as all of them clear
+        the ui log area the result of the model call is written to.
+        :return: List of the buttons.
+        """
+        codes = itertools.chain(TinkUI._FILE_IN_BUTTONS, TinkUI._FILE_OUT_BUTTONS, TinkUI._COMMAND_BUTTONS)
+        return [self._buttons[code] for code, _, _ in codes] + [self._buttons['btn_clear_logs']]
+
+    def _run_async(self, func, *args, on_done=None, widgets=()):
+        """
+        Execute a (blocking) function in a worker thread of the ui.
+
+        :param func: The function to be executed.
+        :param args: Positional arguments passed to the function.
+        :param on_done: Optional callback invoked within the ui thread with the completed
+        future once the function has finished.
+        :param widgets: Optional widgets which will be disabled while the function is running
+        in order to prevent actions from being triggered meanwhile.
+        :return: The future of the submitted function.
+        """
+        for widget in widgets:
+            widget.configure(state=tk.DISABLED)
+
+        def done(f: concurrent.futures.Future):
+            for w in widgets:
+                w.configure(state=tk.NORMAL)
+            if on_done:
+                on_done(f)
+
+        future = self._executor.submit(func, *args)
+        self._when_done(future, done)
+
+        return future
+
+    def _when_done(self, future: concurrent.futures.Future, callback):
+        """
+        Invoke a callback within the ui thread as soon as a future has completed.
+        Tk widgets must not be touched by worker threads, that is why the future is
+        polled using the Tk event loop instead of registering a done callback.
+
+        :param future: The future to be observed.
+        :param callback: Function which will be called with the completed future.
+        :return: Void.
+        """
+        if future.done():
+            callback(future)
+        else:
+            self.window.after(TinkUI.POLL_INTERVAL_MS, self._when_done, future, callback)
 
     def call_model_process_actions(self):
         """
-        Call all supported actions within the model facade.
+        Call all supported actions within the model facade. The actions depend on each
+        other and therefore run one after the other: Each action is submitted to a worker
+        thread once the previous one has finished and its result has been displayed.
+        The buttons writing into the ui log area are disabled meanwhile (see _busy_widgets).
+        :return: Void.
+        """
+        widgets = self._busy_widgets()
+
+        self._put_banner('Process all actions in one pipeline', nl=2)
+
+        for widget in widgets:
+            widget.configure(state=tk.DISABLED)
+
+        self._process_next(iter(self._model.process_actions), widgets)
+
+    def _process_next(self, actions, widgets=()):
+        """
+        Run the next action of the process pipeline in a worker thread.
+        :param actions: Iterator over the remaining actions of the pipeline.
+        :param widgets: The widgets to be enabled again once the pipeline has finished.
         :return: Void.
         """
-        msg = f'{self.__class__.__name__}.{sys._getframe().f_code.co_name}'
-        logging.info(msg)
+        action = next(actions, None)
 
-        action = 'Process all actions in one pipeline'
-        self._put_result_log(text=f'*** {action} ***',
-                             clear=True,
-                             time=False,
-                             nl=2)
+        if action is None:
+            for widget in widgets:
+                widget.configure(state=tk.NORMAL)
+            return
 
-        for action in self._model.process_actions:
-            method = action['method']
-            logging.info(f'Action: {action} => Trying to dynamically invoke method {method}')
-            rl: model.TinkModelResultList = method()
-            filters = self._model.supported_action_filters(method)
-            self._put_result_log(rl.summary(filters=filters), nl=2)
+        method = action['method']
+        _log.info('Action: %s => Trying to dynamically invoke method %s', action, method)
+
+        self._run_async(method, on_done=lambda f: self._show_process_result(method, f, actions, widgets))
+
+    def _show_process_result(self, method, future: concurrent.futures.Future, actions, widgets=()):
+        """
+        Display the outcome of an action of the process pipeline and continue with the next
+        action. The pipeline stops at the first action that raised an exception.
+        :param method: Reference to the method model.* that has been invoked.
+        :param future: The completed future wrapping the model.TinkModelResultList.
+        :param actions: Iterator over the remaining actions of the pipeline.
+        :param widgets: The widgets to be enabled again once the pipeline has finished.
+        :return: Void.
+        """
+        try:
+            rl: model.TinkModelResultList = future.result()
+        except Exception as e:
+            self._put_result_log(f'Exception {type(e)}:\n{str(e)}')
+            _log.debug('Model call %s failed', method.__name__, exc_info=True)
+            actions = iter(())
+        else:
+            self._render_result(rl, filters=self._model.supported_action_filters(method), nl=2)
+
+        self._process_next(actions, widgets)
 
     def show_file_content(self, filename):
         """
         Event Handler for the corresponding button cb_<method_name>
+        The file is read and written into the ui log area in chunks of FILE_CHUNK_ROWS rows
+        so that the ui stays responsive and only one chunk of the file is held at a time.
 
         :return: void
         """
-        self._put_result_log(text=f'*** File content {filename} ***', clear=True, time=False)
+        self._put_banner(f'File content {filename}')
+
+        rows = utl.FileHandler().iter_csv_file(filename=filename,
+                                               skip_header=False)
+        chunks = map(utl.csv_rows_to_string,
+                     iter(lambda: list(itertools.islice(rows, TinkUI.FILE_CHUNK_ROWS)), []))
+
+        self._show_file_chunks(self._log_generation, chunks, False)
+
+    def _show_file_chunks(self, generation: int, chunks, shown: bool):
+        """
+        Write the next chunk of a file content into the output (in the ui log area) and
+        schedule the following one. Streaming ends as soon as the ui log area is cleared.
+
+        :param generation: The generation of the ui log area the content belongs to.
+        :param chunks: Iterator over the remaining formatted chunks of the file content.
+        :param shown: Flag indicating whether any chunk has been shown so far.
+        :return: Void.
+        """
+        if generation != self._log_generation:
+            return
 
-        fh = utl.FileHandler()
         try:
-            lst_data = fh.read_csv_file(filename=filename,
-                                        skip_header=False)
-            if data:
-                text = utl.list_to_string(lst_data)
-            else:
-                text = 'No data available'
-            self._put_result_log(text=text, time=False)
+            text = next(chunks, None)
         except Exception as e:
-            self._put_result_log(str(e))
\ No newline at end of file
+            self._put_result_log(str(e))
+            return
+
+        if text is None:
+            if not shown:
+                self._put_result_log(text='No data available', time=False)
+            else:
+                self._put_result_log(text='', time=False)
+            return
+
+        self._put_result_log(text=text, nl=0, time=False)
+        self.window.after(1, self._show_file_chunks, generation, chunks, True)